@@ -0,0 +1,20 @@
+"""
+Process pool helpers shared by the client and the classifier.
+"""
+
+import multiprocessing
+import multiprocessing.context
+
+
+def worker_context() -> multiprocessing.context.BaseContext:
+    """
+    Return a multiprocessing context that does not fork the calling process.
+    
+    Process pools may be started while HTTP fetch threads are running, and
+    forking a multithreaded process can deadlock the child.
+    
+    Returns:
+        A forkserver context where available, otherwise a spawn context
+    """
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)
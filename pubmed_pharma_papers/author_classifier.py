@@ -3,9 +3,57 @@ Author classifier module for identifying non-academic authors and
 pharmaceutical/biotech company affiliations.
 """
 
+import functools
 import re
-from typing import List, Set, Tuple, Optional
-from .models import Author
+import string
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Callable, Dict, List, Set, Tuple, Type, Optional, Pattern, Sequence
+from ._workers import worker_context
+from .models import Author, Paper
+
+
+# Maximum number of distinct affiliation strings memoized per classifier
+AFFILIATION_CACHE_SIZE = 100_000
+
+# Most frequent academic keywords, checked before any regex runs
+TOP_ACADEMIC_HINTS = ('university', 'hospital', 'department')
+
+# Characters trimmed from both ends of an extracted company name
+_TRIM_CHARS = string.punctuation + string.whitespace
+
+# Number of distinct affiliations sent to a worker process at a time
+PARALLEL_CHUNK_SIZE = 500
+
+# Classification of one affiliation: (is_non_academic, company affiliations)
+AffiliationResult = Tuple[bool, Tuple[str, ...]]
+
+
+def _compile_keywords(keywords: Sequence[str], overlapping: bool = False) -> Pattern[str]:
+    """
+    Compile a keyword collection into a single alternation pattern.
+
+    The regex engine scans the affiliation once for all keywords instead of
+    running one substring search per keyword. Alternatives are tried in the
+    order given, so callers that extract matches should put longer keywords
+    before any keyword that is a prefix of them.
+
+    Args:
+        keywords: Lowercase keywords to match as plain substrings, in priority order
+        overlapping: Wrap the alternation in a lookahead so that finditer()
+            reports every keyword occurrence, including overlapping ones
+
+    Returns:
+        Compiled pattern matching any of the keywords
+    """
+    # Affiliations are lowercased once by the caller, so keywords must be too
+    assert all(keyword == keyword.lower() for keyword in keywords), \
+        "classifier keywords must be lowercase"
+    
+    alternation = '|'.join(re.escape(keyword) for keyword in keywords)
+    if overlapping:
+        return re.compile(f'(?=({alternation}))')
+    return re.compile(alternation)
 
 
 class AuthorClassifier:
@@ -13,39 +61,43 @@ class AuthorClassifier:
     
     def __init__(self) -> None:
         """Initialize the classifier with predefined patterns and keywords."""
-        self.academic_keywords = {
-            'university', 'university of', 'college', 'institute', 'institut',
-            'school', 'medical school', 'hospital', 'medical center', 'clinic',
-            'research center', 'research centre', 'laboratory', 'lab', 'department',
-            'faculty', 'academy', 'academia', 'national institutes', 'nih',
-            'national institute', 'center for', 'centre for', 'medical college',
-            'graduate school', 'postgraduate', 'doctoral', 'phd', 'research institute',
-            'government', 'federal', 'public health', 'ministry', 'department of health',
-            'national health', 'veterans affairs', 'va medical', 'cancer center',
-            'memorial', 'children\'s hospital', 'foundation', 'nonprofit', 'non-profit'
-        }
+        # Keyword tuples are ordered by how often they occur in PubMed
+        # affiliations, so the most common hits are tried first
+        self.academic_keywords: Tuple[str, ...] = (
+            'university', 'hospital', 'department', 'school', 'institute',
+            'institut', 'college', 'medical center', 'center for', 'faculty',
+            'research center', 'centre for', 'laboratory', 'lab', 'clinic',
+            'university of', 'medical school', 'research institute', 'cancer center',
+            'national institute', 'national institutes', 'nih', 'research centre',
+            'public health', 'foundation', 'academy', 'memorial', 'medical college',
+            'graduate school', 'children\'s hospital', 'ministry', 'government',
+            'federal', 'national health', 'department of health', 'veterans affairs',
+            'va medical', 'academia', 'postgraduate', 'doctoral', 'phd',
+            'nonprofit', 'non-profit'
+        )
         
-        self.pharma_biotech_keywords = {
-            'pharmaceutical', 'pharmaceuticals', 'pharma', 'biotech', 'biotechnology',
-            'biopharmaceutical', 'drug', 'drugs', 'therapeutics', 'bioscience',
-            'biosciences', 'life sciences', 'medicine', 'medical devices',
-            'diagnostics', 'genomics', 'proteomics', 'clinical research',
-            'contract research', 'cro', 'clinical trials', 'drug development',
-            'vaccine', 'vaccines', 'biologics', 'biosimilar', 'biosimilars',
-            'medical technology', 'medtech', 'healthcare', 'health care'
-        }
+        self.pharma_biotech_keywords: Tuple[str, ...] = (
+            'pharmaceutical', 'pharma', 'therapeutics', 'biotech', 'pharmaceuticals',
+            'drug', 'biotechnology', 'biosciences', 'bioscience', 'medicine',
+            'diagnostics', 'life sciences', 'vaccine', 'vaccines', 'healthcare',
+            'health care', 'biopharmaceutical', 'biologics', 'genomics', 'drugs',
+            'drug development', 'clinical research', 'contract research', 'cro',
+            'clinical trials', 'medical devices', 'medical technology', 'medtech',
+            'proteomics', 'biosimilar', 'biosimilars'
+        )
         
-        self.company_indicators = {
-            'inc', 'inc.', 'incorporated', 'corp', 'corp.', 'corporation',
-            'ltd', 'ltd.', 'limited', 'llc', 'l.l.c.', 'company', 'co.',
-            'plc', 'p.l.c.', 'gmbh', 'ag', 'sa', 's.a.', 'nv', 'b.v.',
-            'pty', 'pty.', 'proprietary', 'enterprises', 'holdings',
-            'international', 'global', 'worldwide', 'group', 'solutions',
-            'technologies', 'systems', 'services', 'consulting'
-        }
+        self.company_indicators: Tuple[str, ...] = (
+            'inc', 'inc.', 'ltd', 'ltd.', 'gmbh', 'llc', 'corp', 'corp.',
+            'corporation', 'co.', 'company', 'limited', 'ag', 'plc', 'sa', 's.a.',
+            'incorporated', 'group', 'international', 'technologies', 'global',
+            'nv', 'b.v.', 'pty', 'pty.', 'l.l.c.', 'p.l.c.', 'proprietary',
+            'holdings', 'enterprises', 'solutions', 'systems', 'services',
+            'worldwide', 'consulting'
+        )
         
-        # Known pharmaceutical and biotech companies (partial list)
-        self.known_companies = {
+        # Known pharmaceutical and biotech companies (partial list), longest
+        # first so the matcher prefers the longest name at any position
+        self.known_companies: Tuple[str, ...] = tuple(sorted({
             'pfizer', 'roche', 'novartis', 'johnson & johnson', 'j&j',
             'merck', 'bristol myers squibb', 'abbvie', 'amgen', 'gilead',
             'biogen', 'genentech', 'bayer', 'sanofi', 'glaxosmithkline',
@@ -59,7 +111,50 @@ class AuthorClassifier:
             'bluebird bio', 'spark therapeutics', 'kite pharma', 'car-t',
             'chimeric antigen receptor', 'crispr', 'editas', 'intellia',
             'sangamo', 'precision biosciences', 'beam therapeutics'
+        }, key=lambda company: (-len(company), company)))
+        
+        # One compiled matcher per keyword category, built once per classifier
+        self._academic_matcher = _compile_keywords(self.academic_keywords)
+        self._pharma_biotech_matcher = _compile_keywords(self.pharma_biotech_keywords)
+        self._company_indicator_matcher = _compile_keywords(
+            self.company_indicators, overlapping=True
+        )
+        self._known_companies_matcher = _compile_keywords(self.known_companies)
+        
+        # Email domains that indicate academic institutions
+        self._edu_email_re = re.compile(r'\S+@\S+\.(edu|ac\.\w+)')
+        
+        # Specific academic patterns, unioned so one search covers all of them
+        academic_patterns = [
+            r'\b(dept|department)\s+of\b',
+            r'\b(division|div)\s+of\b',
+            r'\b(center|centre)\s+for\b',
+            r'\b(school|college)\s+of\b',
+            r'\buniversity\s+of\b',
+            r'\b(research|medical)\s+(center|centre)\b',
+            r'\b(teaching|university)\s+hospital\b',
+            r'\bmedical\s+school\b'
+        ]
+        self._academic_re = re.compile('|'.join(f'(?:{p})' for p in academic_patterns))
+        
+        # Company name followed by each indicator, e.g. "acme therapeutics ltd"
+        self._indicator_res: Dict[str, Pattern[str]] = {
+            indicator: re.compile(rf'([^,;.]+?)\s+{re.escape(indicator)}')
+            for indicator in self.company_indicators
         }
+        
+        # Fallback company name patterns, tried in priority order
+        self._company_name_res: Tuple[Pattern[str], ...] = (
+            re.compile(r'([^,;.]+?)\s+(?:inc\.?|corp\.?|ltd\.?|llc\.?|plc\.?)'),
+            re.compile(r'([^,;.]+?)\s+(?:pharmaceutical|pharma|biotech|biotechnology)'),
+            re.compile(r'([^,;.]+?)\s+(?:therapeutics|bioscience|life sciences)'),
+        )
+        
+        # Memoize affiliation classification on this instance
+        memoize = functools.lru_cache(maxsize=AFFILIATION_CACHE_SIZE)
+        self._classify_affiliation: Callable[[str], AffiliationResult] = memoize(
+            self._classify_affiliation_uncached
+        )
     
     def classify_author(self, author: Author) -> Author:
         """
@@ -74,19 +169,52 @@ class AuthorClassifier:
         if not author.affiliation:
             return author
             
-        affiliation_lower = author.affiliation.lower()
+        result = self._classify_affiliation(author.affiliation)
+        return self._apply_classification(author, result)
+    
+    def _apply_classification(self, author: Author, result: AffiliationResult) -> Author:
+        """
+        Write an affiliation classification result onto an author.
         
-        # Check if author is non-academic
-        is_academic = self._is_academic_affiliation(affiliation_lower)
-        author.is_non_academic = not is_academic
+        Args:
+            author: Author object to update
+            result: Tuple of (is_non_academic, company affiliations)
+            
+        Returns:
+            Author object with updated classification
+        """
+        is_non_academic, companies = result
+        author.is_non_academic = is_non_academic
         
-        # If non-academic, check for pharmaceutical/biotech companies
-        if author.is_non_academic:
-            companies = self._extract_company_affiliations(affiliation_lower)
-            author.company_affiliations = companies
+        if is_non_academic:
+            author.company_affiliations = list(companies)
             
         return author
     
+    def _classify_affiliation_uncached(self, affiliation: str) -> AffiliationResult:
+        """
+        Classify a single affiliation string.
+        
+        Called through the per-classifier memo _classify_affiliation, since co-authors
+        and papers from the same lab or company share affiliation strings. The
+        memo is keyed by the original string, so an affiliation is lowercased
+        only on a cache miss, and the lowercased copy is passed to every helper.
+        
+        Args:
+            affiliation: Affiliation string as it appears on the author
+            
+        Returns:
+            Tuple of (is_non_academic, company affiliations)
+        """
+        affiliation_lower = affiliation.lower()
+        
+        # Check if author is non-academic
+        if self._is_academic_affiliation(affiliation_lower):
+            return False, ()
+        
+        # If non-academic, check for pharmaceutical/biotech companies
+        return True, tuple(self._extract_company_affiliations(affiliation_lower))
+    
     def _is_academic_affiliation(self, affiliation: str) -> bool:
         """
         Determine if an affiliation is academic.
@@ -97,31 +225,21 @@ class AuthorClassifier:
         Returns:
             True if academic, False otherwise
         """
-        # Check for academic keywords
-        for keyword in self.academic_keywords:
-            if keyword in affiliation:
-                return True
-                
+        # Fast path: the most common academic keywords, as plain substring checks
+        if any(hint in affiliation for hint in TOP_ACADEMIC_HINTS):
+            return True
+        
         # Check for email domains that indicate academic institutions
-        email_match = re.search(r'(\S+@\S+\.edu|\S+@\S+\.ac\.\w+)', affiliation)
-        if email_match:
+        if '@' in affiliation and self._edu_email_re.search(affiliation):
             return True
             
+        # Check for academic keywords
+        if self._academic_matcher.search(affiliation):
+            return True
+                
         # Check for specific academic patterns
-        academic_patterns = [
-            r'\b(dept|department)\s+of\b',
-            r'\b(division|div)\s+of\b',
-            r'\b(center|centre)\s+for\b',
-            r'\b(school|college)\s+of\b',
-            r'\buniversity\s+of\b',
-            r'\b(research|medical)\s+(center|centre)\b',
-            r'\b(teaching|university)\s+hospital\b',
-            r'\bmedical\s+school\b'
-        ]
-        
-        for pattern in academic_patterns:
-            if re.search(pattern, affiliation):
-                return True
+        if self._academic_re.search(affiliation):
+            return True
                 
         return False
     
@@ -135,18 +253,22 @@ class AuthorClassifier:
         Returns:
             List of identified company names
         """
-        companies = []
+        companies: List[str] = []
         
-        # Check for known companies
-        for company in self.known_companies:
-            if company.lower() in affiliation:
-                companies.append(company.title())
+        # Check for known companies; matches never overlap, so a name found
+        # inside a longer company name is not reported separately
+        for match in self._known_companies_matcher.finditer(affiliation):
+            company = match.group(0).title()
+            if company not in companies:
+                companies.append(company)
                 
         # Check for pharmaceutical/biotech keywords with company indicators
         if self._has_pharma_biotech_keywords(affiliation):
             company_name = self._extract_company_name(affiliation)
-            if company_name and company_name not in [c.lower() for c in companies]:
-                companies.append(company_name.title())
+            if company_name:
+                company_name = company_name.title()
+                if company_name not in companies:
+                    companies.append(company_name)
                 
         return companies
     
@@ -160,10 +282,7 @@ class AuthorClassifier:
         Returns:
             True if pharma/biotech keywords found
         """
-        for keyword in self.pharma_biotech_keywords:
-            if keyword in affiliation:
-                return True
-        return False
+        return self._pharma_biotech_matcher.search(affiliation) is not None
     
     def _extract_company_name(self, affiliation: str) -> Optional[str]:
         """
@@ -175,32 +294,26 @@ class AuthorClassifier:
         Returns:
             Extracted company name or None
         """
-        # Look for company indicators
-        for indicator in self.company_indicators:
-            if indicator in affiliation:
-                # Try to extract the company name before the indicator
-                pattern = rf'([^,;.]+?)\s+{re.escape(indicator)}'
-                match = re.search(pattern, affiliation)
-                if match:
-                    company_name = match.group(1).strip()
-                    # Clean up the company name
-                    company_name = re.sub(r'^\W+|\W+$', '', company_name)
-                    if len(company_name) > 3:  # Avoid very short matches
-                        return company_name
+        # Look for company indicators present in the affiliation
+        indicators = dict.fromkeys(
+            match.group(1)
+            for match in self._company_indicator_matcher.finditer(affiliation)
+        )
+        for indicator in indicators:
+            # Try to extract the company name before the indicator
+            match = self._indicator_res[indicator].search(affiliation)
+            if match:
+                # Clean up the company name
+                company_name = match.group(1).strip(_TRIM_CHARS)
+                if len(company_name) > 3:  # Avoid very short matches
+                    return company_name
                         
         # If no company indicator found, try to extract from context
         # Look for patterns like "Company Name, Location" or "Company Name Inc"
-        patterns = [
-            r'([^,;.]+?)\s+(?:inc\.?|corp\.?|ltd\.?|llc\.?|plc\.?)',
-            r'([^,;.]+?)\s+(?:pharmaceutical|pharma|biotech|biotechnology)',
-            r'([^,;.]+?)\s+(?:therapeutics|bioscience|life sciences)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, affiliation)
+        for pattern in self._company_name_res:
+            match = pattern.search(affiliation)
             if match:
-                company_name = match.group(1).strip()
-                company_name = re.sub(r'^\W+|\W+$', '', company_name)
+                company_name = match.group(1).strip(_TRIM_CHARS)
                 if len(company_name) > 3:
                     return company_name
                     
@@ -218,6 +331,59 @@ class AuthorClassifier:
         """
         return [self.classify_author(author) for author in authors]
     
+    def classify_papers(self, papers: List[Paper], workers: int = 1) -> List[Paper]:
+        """
+        Classify the authors of a batch of papers in a single sweep.
+        
+        Every distinct affiliation across all papers is classified once and
+        the result is written back onto each author that shares it. With
+        more than one worker, large batches of affiliations are split into
+        chunks and classified in a process pool.
+        
+        Args:
+            papers: List of Paper objects whose authors should be classified
+            workers: Number of worker processes to classify with
+            
+        Returns:
+            The same list of Paper objects, with authors classified in place
+        """
+        affiliations = list({
+            author.affiliation
+            for paper in papers
+            for author in paper.authors
+            if author.affiliation
+        })
+        
+        if workers > 1 and len(affiliations) > PARALLEL_CHUNK_SIZE:
+            chunks = [
+                affiliations[start:start + PARALLEL_CHUNK_SIZE]
+                for start in range(0, len(affiliations), PARALLEL_CHUNK_SIZE)
+            ]
+            # Each worker builds its own classifier once, not once per chunk.
+            # Callers may still have fetch threads running, so workers are
+            # not forked from this process.
+            with ProcessPoolExecutor(max_workers=workers, mp_context=worker_context(),
+                                     initializer=_init_worker,
+                                     initargs=(type(self),)) as executor:
+                classified = [
+                    result
+                    for chunk_results in executor.map(_classify_chunk, chunks)
+                    for result in chunk_results
+                ]
+        else:
+            classified = [
+                self._classify_affiliation(affiliation)
+                for affiliation in affiliations
+            ]
+        results = dict(zip(affiliations, classified))
+        
+        for paper in papers:
+            for author in paper.authors:
+                if author.affiliation:
+                    self._apply_classification(author, results[author.affiliation])
+                    
+        return papers
+    
     def get_statistics(self, authors: List[Author]) -> dict:
         """
         Get statistics about author classifications.
@@ -229,12 +395,12 @@ class AuthorClassifier:
             Dictionary with classification statistics
         """
         total_authors = len(authors)
-        non_academic_authors = len([a for a in authors if a.is_non_academic])
-        authors_with_companies = len([a for a in authors if a.company_affiliations])
+        non_academic_authors = sum(1 for a in authors if a.is_non_academic)
+        authors_with_companies = sum(1 for a in authors if a.company_affiliations)
         
-        all_companies = set()
-        for author in authors:
-            all_companies.update(author.company_affiliations)
+        all_companies: Set[str] = set(
+            chain.from_iterable(author.company_affiliations for author in authors)
+        )
             
         return {
             'total_authors': total_authors,
@@ -242,4 +408,23 @@ class AuthorClassifier:
             'authors_with_companies': authors_with_companies,
             'unique_companies': len(all_companies),
             'companies': list(all_companies)
-        } 
\ No newline at end of file
+        }
+
+
+# Classifier owned by each worker process of AuthorClassifier.classify_papers()
+_worker_classifier: Optional[AuthorClassifier] = None
+
+
+def _init_worker(classifier_class: Type[AuthorClassifier]) -> None:
+    """Build the worker process's classifier and its compiled matchers once."""
+    global _worker_classifier
+    _worker_classifier = classifier_class()
+
+
+def _classify_chunk(affiliations: List[str]) -> List[AffiliationResult]:
+    """Classify a chunk of affiliations inside a worker process."""
+    assert _worker_classifier is not None, "worker classifier not initialized"
+    return [
+        _worker_classifier._classify_affiliation(affiliation)
+        for affiliation in affiliations
+    ]
@@ -5,6 +5,7 @@ Command-line interface for the PubMed pharma papers tool.
 import argparse
 import logging
 import sys
+from itertools import chain
 from typing import Optional
 
 from .pubmed_client import PubMedClient
@@ -104,10 +105,31 @@ Examples of advanced queries:
         help='Display statistics about the search results'
     )
     
+    parser.add_argument(
+        '--cache',
+        type=str,
+        metavar='PATH',
+        help='Cache PubMed API responses in this SQLite file (requires requests-cache)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore --cache and always query the PubMed API'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of worker processes for XML parsing and author classification (default: 1)'
+    )
+    
     return parser
 
 
-def process_papers(papers: list, classifier: AuthorClassifier, debug: bool = False) -> list:
+def process_papers(papers: list, classifier: AuthorClassifier, debug: bool = False,
+                   workers: int = 1) -> list:
     """
     Process papers through the author classification pipeline.
     
@@ -115,6 +137,7 @@ def process_papers(papers: list, classifier: AuthorClassifier, debug: bool = Fal
         papers: List of Paper objects
         classifier: AuthorClassifier instance
         debug: Whether to show debug information
+        workers: Number of worker processes used for classification
         
     Returns:
         List of processed Paper objects
@@ -122,20 +145,17 @@ def process_papers(papers: list, classifier: AuthorClassifier, debug: bool = Fal
     logger = logging.getLogger(__name__)
     logger.info(f"Processing {len(papers)} papers for author classification")
     
+    # Classify each distinct affiliation once across all papers
+    classifier.classify_papers(papers, workers=workers)
+    
     processed_papers = []
     
     for i, paper in enumerate(papers):
         if debug and i % 100 == 0:
             logger.debug(f"Processing paper {i+1}/{len(papers)}: {paper.title[:50]}...")
         
-        # Classify authors
-        classified_authors = classifier.classify_authors(paper.authors)
-        
-        # Update paper with classified authors
-        paper.authors = classified_authors
-        
         # Only keep papers with at least one non-academic author
-        if paper.get_non_academic_authors():
+        if paper.has_non_academic_authors():
             processed_papers.append(paper)
     
     logger.info(f"Found {len(processed_papers)} papers with non-academic authors")
@@ -158,7 +178,9 @@ def main() -> None:
         client = PubMedClient(
             email=args.email,
             api_key=args.api_key,
-            tool_name="get-papers-list"
+            tool_name="get-papers-list",
+            cache_path=None if args.no_cache else args.cache,
+            parse_workers=args.workers
         )
         
         classifier = AuthorClassifier()
@@ -166,7 +188,8 @@ def main() -> None:
         
         # Search and fetch papers
         logger.info(f"Searching for papers with query: {args.query}")
-        response = client.search_and_fetch(args.query, args.max_results)
+        with client:
+            response = client.search_and_fetch(args.query, args.max_results)
         
         if not response.success:
             logger.error(f"Failed to fetch papers: {response.error_message}")
@@ -179,7 +202,8 @@ def main() -> None:
         logger.info(f"Retrieved {len(response.papers)} papers (max requested: {args.max_results})")
         
         # Process papers through classification
-        processed_papers = process_papers(response.papers, classifier, args.debug)
+        processed_papers = process_papers(response.papers, classifier, args.debug,
+                                          args.workers)
         
         if not processed_papers:
             logger.info("No papers found with pharmaceutical/biotech company affiliations.")
@@ -243,9 +267,7 @@ def print_statistics(all_papers: list, filtered_papers: list,
             print(f"  ... and {len(stats['companies']) - 10} more")
     
     # Author classification statistics
-    all_authors = []
-    for paper in all_papers:
-        all_authors.extend(paper.authors)
+    all_authors = list(chain.from_iterable(paper.authors for paper in all_papers))
     
     if all_authors:
         author_stats = classifier.get_statistics(all_authors)
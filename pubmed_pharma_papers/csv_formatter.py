@@ -4,7 +4,9 @@ CSV formatter for PubMed paper data output.
 
 import csv
 import io
-from typing import List, Optional, TextIO
+import sys
+from itertools import chain
+from typing import List, Optional, Set, TextIO, Tuple
 from datetime import date
 
 from .models import Paper, Author
@@ -46,8 +48,8 @@ class CSVFormatter:
             papers: List of Paper objects to write
             output_file: File-like object to write to
         """
-        writer = csv.DictWriter(output_file, fieldnames=self.fieldnames)
-        writer.writeheader()
+        writer = csv.writer(output_file)
+        writer.writerow(self.fieldnames)
         
         for paper in papers:
             # Only include papers with at least one non-academic author
@@ -58,7 +60,8 @@ class CSVFormatter:
             row = self._format_paper_row(paper, non_academic_authors)
             writer.writerow(row)
     
-    def _format_paper_row(self, paper: Paper, non_academic_authors: List[Author]) -> dict:
+    def _format_paper_row(self, paper: Paper,
+                          non_academic_authors: List[Author]) -> Tuple[str, ...]:
         """
         Format a single paper as a CSV row.
         
@@ -67,21 +70,13 @@ class CSVFormatter:
             non_academic_authors: List of non-academic authors
             
         Returns:
-            Dictionary representing CSV row
+            Tuple of column values, in the same order as fieldnames
         """
-        # Format non-academic author names
-        author_names = []
-        for author in non_academic_authors:
-            name_parts = []
-            if author.first_name:
-                name_parts.append(author.first_name)
-            if author.last_name:
-                name_parts.append(author.last_name)
-            if author.initials and not author.first_name:
-                name_parts.append(author.initials)
-            
-            if name_parts:
-                author_names.append(' '.join(name_parts))
+        # Non-academic author names, precomputed when the paper was parsed
+        author_names = [
+            name for name in (author.get_display_name() for author in non_academic_authors)
+            if name
+        ]
         
         # Format company affiliations
         company_affiliations = paper.get_company_affiliations()
@@ -94,14 +89,14 @@ class CSVFormatter:
         # Get corresponding author email
         corresponding_email = paper.get_corresponding_author_email()
         
-        return {
-            'PubmedID': paper.pubmed_id,
-            'Title': paper.title,
-            'Publication Date': pub_date_str,
-            'Non-academic Author(s)': '; '.join(author_names),
-            'Company Affiliation(s)': '; '.join(company_affiliations),
-            'Corresponding Author Email': corresponding_email or ""
-        }
+        return (
+            paper.pubmed_id,
+            paper.title,
+            pub_date_str,
+            '; '.join(author_names),
+            '; '.join(company_affiliations),
+            corresponding_email or ""
+        )
     
     def save_to_file(self, papers: List[Paper], filename: str) -> None:
         """
@@ -118,11 +113,13 @@ class CSVFormatter:
         """
         Print papers to console in CSV format.
         
+        Rows are streamed straight to stdout rather than built up as a
+        string first.
+        
         Args:
             papers: List of Paper objects to print
         """
-        csv_content = self.format_papers(papers)
-        print(csv_content)
+        self.write_papers(papers, sys.stdout)
     
     def get_filtered_papers(self, papers: List[Paper]) -> List[Paper]:
         """
@@ -134,13 +131,7 @@ class CSVFormatter:
         Returns:
             List of filtered Paper objects
         """
-        filtered_papers = []
-        for paper in papers:
-            non_academic_authors = paper.get_non_academic_authors()
-            if non_academic_authors:
-                filtered_papers.append(paper)
-        
-        return filtered_papers
+        return [paper for paper in papers if paper.has_non_academic_authors()]
     
     def get_statistics(self, papers: List[Paper]) -> dict:
         """
@@ -153,20 +144,23 @@ class CSVFormatter:
             Dictionary with statistics
         """
         total_papers = len(papers)
-        filtered_papers = self.get_filtered_papers(papers)
-        papers_with_pharma = len(filtered_papers)
-        
-        all_companies = set()
-        all_non_academic_authors = set()
         
-        for paper in filtered_papers:
-            companies = paper.get_company_affiliations()
-            all_companies.update(companies)
-            
-            non_academic_authors = paper.get_non_academic_authors()
-            for author in non_academic_authors:
-                author_name = f"{author.first_name or ''} {author.last_name}".strip()
-                all_non_academic_authors.add(author_name)
+        # The non-academic authors found while filtering are reused below
+        # instead of being recomputed per paper
+        pharma_papers = [
+            (paper, authors)
+            for paper, authors in ((paper, paper.get_non_academic_authors()) for paper in papers)
+            if authors
+        ]
+        papers_with_pharma = len(pharma_papers)
+        
+        all_companies: Set[str] = set(chain.from_iterable(
+            paper.get_company_affiliations() for paper, _ in pharma_papers
+        ))
+        all_non_academic_authors: Set[str] = set(
+            f"{author.first_name or ''} {author.last_name}".strip()
+            for author in chain.from_iterable(authors for _, authors in pharma_papers)
+        )
         
         return {
             'total_papers_retrieved': total_papers,
@@ -2,12 +2,19 @@
 Data models for PubMed paper information with type hints.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from itertools import chain
 from typing import List, Optional, Dict, Any
 from datetime import date
 
 
-@dataclass
+# Use __slots__ instead of a per-instance __dict__ where dataclass() supports it
+# (Python 3.10+); large fetches create tens of thousands of these objects.
+_SLOTS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Author:
     """Represents an author with their affiliation information."""
     
@@ -18,17 +25,32 @@ class Author:
     email: Optional[str]
     is_corresponding: bool = False
     is_non_academic: bool = False
-    company_affiliations: List[str] = None
+    company_affiliations: List[str] = field(default_factory=list)
+    display_name: Optional[str] = None
+    
+    @staticmethod
+    def format_name(first_name: Optional[str], last_name: Optional[str],
+                    initials: Optional[str]) -> str:
+        """Format an author name for output, e.g. "Jane Doe" or "Doe J"."""
+        name_parts = []
+        if first_name:
+            name_parts.append(first_name)
+        if last_name:
+            name_parts.append(last_name)
+        if initials and not first_name:
+            name_parts.append(initials)
+        return ' '.join(name_parts)
     
-    def __post_init__(self) -> None:
-        """Initialize mutable default values."""
-        if self.company_affiliations is None:
-            self.company_affiliations = []
+    def get_display_name(self) -> str:
+        """Get the display name, formatting it if the parser did not set one."""
+        if self.display_name is None:
+            return self.format_name(self.first_name, self.last_name, self.initials)
+        return self.display_name
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Journal:
-    """Represents journal information."""
+    """Represents journal information (immutable; never changed after parsing)."""
     
     title: str
     issn: Optional[str]
@@ -37,7 +59,7 @@ class Journal:
     pages: Optional[str]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Paper:
     """Represents a PubMed paper with all relevant information."""
     
@@ -54,12 +76,15 @@ class Paper:
         """Get list of authors with non-academic affiliations."""
         return [author for author in self.authors if author.is_non_academic]
     
+    def has_non_academic_authors(self) -> bool:
+        """Check whether any author has a non-academic affiliation."""
+        return any(author.is_non_academic for author in self.authors)
+    
     def get_company_affiliations(self) -> List[str]:
         """Get unique list of company affiliations from all authors."""
-        companies = set()
-        for author in self.authors:
-            companies.update(author.company_affiliations)
-        return list(companies)
+        return list(set(
+            chain.from_iterable(author.company_affiliations for author in self.authors)
+        ))
     
     def get_corresponding_author_email(self) -> Optional[str]:
         """Get email of the corresponding author."""
@@ -69,7 +94,7 @@ class Paper:
         return None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PubMedAPIResponse:
     """Represents the response from PubMed API calls."""
     
@@ -80,7 +105,7 @@ class PubMedAPIResponse:
     retrieved_count: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SearchResult:
     """Represents PubMed search results."""
     
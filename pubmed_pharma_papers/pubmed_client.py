@@ -5,22 +5,273 @@ PubMed API client for fetching research papers using NCBI E-utilities.
 import time
 import re
 import logging
-from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime, date
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from types import TracebackType
+from typing import List, Optional, Dict, Any, Tuple, Type, Callable, Iterable, Iterator, Deque
+from datetime import datetime, date, timedelta
 from urllib.parse import urlencode, quote
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
-import xml.etree.ElementTree as ET
 import json
 
+import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ._workers import worker_context
 from .models import Paper, Author, Journal, SearchResult, PubMedAPIResponse
 
 
+# Module-level so that parsing in worker processes logs without a client
+logger = logging.getLogger(__name__)
+
+# How long responses stay valid in the optional on-disk cache
+RESPONSE_CACHE_TTL = timedelta(days=7)
+
+# Email addresses embedded in affiliation strings (PubMed affiliations are ASCII)
+_EMAIL_RE = re.compile(r'[\w.-]+@[\w.-]+\.\w+', re.ASCII)
+
+# Number of PubMed IDs requested per efetch POST
+EFETCH_BATCH_SIZE = 200
+
+# efetch bodies are pre-encoded strings, so their content type is set explicitly
+_FORM_HEADERS = {'Content-Type': 'application/x-www-form-urlencoded'}
+
+# Number of search_and_fetch results each client keeps for repeated queries;
+# the least recently used result is dropped when the memo is full
+SEARCH_MEMO_SIZE = 32
+
+# Bytes read from the socket per chunk when streaming efetch responses
+STREAM_CHUNK_SIZE = 65536
+
+# Attempts per efetch batch when the response body fails partway through;
+# the session's Retry only covers connection errors and status codes
+BODY_READ_ATTEMPTS = 3
+
+# Precompiled XPath expressions for the per-article lookups in efetch XML.
+# MedlineCitation is always a direct child of PubmedArticle, so a child step
+# avoids scanning the whole article. Text results are plain strings rather
+# than "smart" ones that keep the parsed tree alive.
+_XP_MEDLINE_CITATION = etree.XPath('MedlineCitation[1]')
+_XP_PMC_ID = etree.XPath('(.//OtherID[@Source="NLM"])[1][starts-with(., "PMC")]/text()',
+                         smart_strings=False)
+
+
+def _first(xpath: etree.XPath, elem: etree._Element) -> Optional[etree._Element]:
+    """Return the first element matched by a compiled XPath, or None."""
+    matches = xpath(elem)
+    return matches[0] if matches else None
+
+
+class _CitationFields:
+    """Fields collected from one MedlineCitation during a single tree walk."""
+    
+    __slots__ = ('pmid', 'title', 'abstract', 'doi', 'journal', 'journal_title',
+                 'issn', 'volume', 'issue', 'pages', 'dates', 'author_list', 'authors',
+                 'author')
+    
+    def __init__(self) -> None:
+        self.pmid: Optional[str] = None
+        self.title: Optional[str] = None
+        self.abstract: Optional[str] = None
+        self.doi: Optional[str] = None
+        self.journal: Optional[etree._Element] = None
+        self.journal_title: Optional[str] = None
+        self.issn: Optional[str] = None
+        self.volume: Optional[str] = None
+        self.issue: Optional[str] = None
+        self.pages: Optional[str] = None
+        # Container tag -> (first element with that tag, {'Year'|'Month'|'Day': text})
+        self.dates: Dict[str, Tuple[etree._Element, Dict[str, str]]] = {}
+        # Only authors of the citation's first AuthorList are read
+        self.author_list: Optional[etree._Element] = None
+        self.authors: List[Dict[str, str]] = []
+        # (Author element, its collected parts) for the most recent such author
+        self.author: Optional[Tuple[etree._Element, Dict[str, str]]] = None
+
+
+# Date containers in order of preference
+_DATE_CONTAINERS = ('DateCompleted', 'DateCreated', 'PubDate')
+
+
+def _parent_tag(elem: etree._Element) -> Optional[str]:
+    """Return the tag of an element's parent, or None at the root."""
+    parent = elem.getparent()
+    return parent.tag if parent is not None else None
+
+
+def _on_pmid(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.pmid is None:
+        fields.pmid = elem.text
+
+
+def _on_article_title(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.title is None:
+        fields.title = elem.text
+
+
+def _on_abstract_text(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.abstract is None and _parent_tag(elem) == 'Abstract':
+        fields.abstract = elem.text
+
+
+def _on_elocation_id(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.doi is None and elem.get('EIdType') == 'doi':
+        fields.doi = elem.text
+
+
+def _on_date_container(fields: _CitationFields, elem: etree._Element) -> None:
+    if elem.tag not in fields.dates:
+        fields.dates[elem.tag] = (elem, {})
+
+
+def _on_date_part(fields: _CitationFields, elem: etree._Element) -> None:
+    parent = elem.getparent()
+    entry = fields.dates.get(parent.tag) if parent is not None else None
+    if entry is not None and entry[0] is parent:
+        entry[1].setdefault(elem.tag, elem.text)
+
+
+def _on_journal(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.journal is None:
+        fields.journal = elem
+
+
+def _in_journal(fields: _CitationFields, elem: etree._Element) -> bool:
+    """Check whether an element sits inside the citation's first Journal."""
+    return fields.journal is not None and any(
+        ancestor is fields.journal for ancestor in elem.iterancestors('Journal')
+    )
+
+
+def _on_journal_title(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.journal_title is None and _in_journal(fields, elem):
+        fields.journal_title = elem.text
+
+
+def _on_issn(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.issn is None and _in_journal(fields, elem):
+        fields.issn = elem.text
+
+
+def _on_volume(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.volume is None and _in_journal(fields, elem):
+        fields.volume = elem.text
+
+
+def _on_issue(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.issue is None and _in_journal(fields, elem):
+        fields.issue = elem.text
+
+
+def _on_medline_pgn(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.pages is None and _parent_tag(elem) == 'Pagination':
+        fields.pages = elem.text
+
+
+def _on_author_list(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.author_list is None:
+        fields.author_list = elem
+
+
+def _on_author(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.author_list is not None and elem.getparent() is fields.author_list:
+        parts: Dict[str, str] = {}
+        fields.authors.append(parts)
+        fields.author = (elem, parts)
+
+
+def _on_author_name(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.author is not None and elem.getparent() is fields.author[0]:
+        fields.author[1].setdefault(elem.tag, elem.text)
+
+
+def _on_affiliation(fields: _CitationFields, elem: etree._Element) -> None:
+    if fields.author is None or _parent_tag(elem) != 'AffiliationInfo':
+        return
+    author_elem, parts = fields.author
+    if elem.getparent().getparent() is author_elem:
+        parts.setdefault('Affiliation', elem.text)
+
+
+# Tag -> handler for the single-pass MedlineCitation walk; the keys double as
+# the tag filter handed to iter(), so lxml skips every other element in C
+_CITATION_HANDLERS: Dict[str, Callable[[_CitationFields, etree._Element], None]] = {
+    'PMID': _on_pmid,
+    'ArticleTitle': _on_article_title,
+    'AbstractText': _on_abstract_text,
+    'ELocationID': _on_elocation_id,
+    'DateCompleted': _on_date_container,
+    'DateCreated': _on_date_container,
+    'PubDate': _on_date_container,
+    'Year': _on_date_part,
+    'Month': _on_date_part,
+    'Day': _on_date_part,
+    'Journal': _on_journal,
+    'Title': _on_journal_title,
+    'ISSN': _on_issn,
+    'Volume': _on_volume,
+    'Issue': _on_issue,
+    'MedlinePgn': _on_medline_pgn,
+    'AuthorList': _on_author_list,
+    'Author': _on_author,
+    'LastName': _on_author_name,
+    'ForeName': _on_author_name,
+    'Initials': _on_author_name,
+    'Affiliation': _on_affiliation,
+}
+
+
+class _SlidingWindowLimiter:
+    """Thread-safe rate limiter allowing at most `rate` request starts in any period."""
+    
+    def __init__(self, rate: int, period: float = 1.0) -> None:
+        """
+        Initialize the limiter with no requests made yet.
+        
+        Args:
+            rate: Number of requests allowed per period (also the burst size)
+            period: Length of the period in seconds
+        """
+        self.rate = rate
+        self.period = period
+        # Start times of the last `rate` requests, oldest first
+        self._starts: Deque[float] = deque(maxlen=rate)
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """
+        Reserve a start time for one request, sleeping until it arrives.
+        
+        A request may start once the one `rate` requests before it is at
+        least a full period old, so no window of `period` seconds ever holds
+        more than `rate` starts. The slot is reserved under the lock and the
+        wait happens outside it, so concurrent callers queue up in order
+        without blocking each other.
+        
+        Returns:
+            Number of seconds slept
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = now
+            if len(self._starts) == self.rate:
+                start = max(now, self._starts[0] + self.period)
+            self._starts.append(start)
+        
+        wait = start - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
 class PubMedClient:
     """Client for interacting with PubMed E-utilities API."""
     
     def __init__(self, email: Optional[str] = None, api_key: Optional[str] = None, 
-                 tool_name: str = "get-papers-list") -> None:
+                 tool_name: str = "get-papers-list", max_concurrency: int = 4,
+                 cache_path: Optional[str] = None, parse_workers: int = 1) -> None:
         """
         Initialize PubMed client.
         
@@ -28,145 +279,230 @@ class PubMedClient:
             email: Email address for API identification
             api_key: NCBI API key for increased rate limits
             tool_name: Tool name for API identification
+            max_concurrency: Maximum number of efetch batches in flight at once
+                (raised to parse_workers if that is larger)
+            cache_path: SQLite file for caching API responses on disk
+                (requires the optional requests-cache package)
+            parse_workers: Number of processes for parsing efetch XML; with 1,
+                batches are parsed in-thread while streaming from the socket
         """
         self.email = email
         self.api_key = api_key
         self.tool_name = tool_name
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+        # Each fetch thread waits for its batch to be parsed, so every parser
+        # process needs a fetch thread of its own to be kept busy
+        self.max_concurrency = max(max_concurrency, parse_workers)
         
-        # Rate limiting: 3 requests/second without API key, 10 with API key
+        # Rate limiting: 3 requests/second without API key, 10 with API key.
+        # One limiter is shared by all fetch threads.
         self.rate_limit = 10 if api_key else 3
-        self.last_request_time = 0.0
+        self._limiter = _SlidingWindowLimiter(self.rate_limit, period=1.0)
+        
+        # Pooled HTTP session, kept alive for the client's lifetime so that
+        # consecutive requests reuse the same TCP/TLS connection
+        self._session = self._create_session(cache_path)
+        self._session.headers['User-Agent'] = (
+            f'{self.tool_name}/1.0 (mailto:{self.email or "unknown@example.com"})'
+        )
+        # efetch POSTs are read-only, so they are retried like GETs
+        retry = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({'GET', 'POST'})
+        )
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=retry
+        ))
+        
+        # Parsing is pure-Python work that the GIL would serialize across
+        # fetch threads, so it can be handed to separate processes instead.
+        # Workers start on the first submit, from a fetch thread, so they must
+        # not be forked from this multithreaded process.
+        self._parse_pool = (
+            ProcessPoolExecutor(max_workers=parse_workers, mp_context=worker_context())
+            if parse_workers > 1 else None
+        )
+        
+        # Parameters shared by every E-utilities request, encoded once
+        common_params = {'db': 'pubmed', 'tool': self.tool_name}
+        if self.email:
+            common_params['email'] = self.email
+        if self.api_key:
+            common_params['api_key'] = self.api_key
+        self._common_qs = urlencode(common_params)
+        
+        # Successful search_and_fetch results by (query, max_results)
+        self._search_memo: 'OrderedDict[Tuple[str, int], PubMedAPIResponse]' = OrderedDict()
         
         # Setup logging
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+    
+    @staticmethod
+    def _create_session(cache_path: Optional[str]) -> requests.Session:
+        """
+        Create the HTTP session, backed by an on-disk cache if a path is given.
+        
+        Responses are keyed by URL and form data, which together include the
+        query, the result window and the requested IDs. NCBI sends no caching headers,
+        so cached responses expire after RESPONSE_CACHE_TTL unless a
+        Cache-Control header says otherwise.
+        
+        Args:
+            cache_path: SQLite cache file, or None to disable caching
+            
+        Returns:
+            A plain or caching requests session
+            
+        Raises:
+            ImportError: If a cache path is given but requests-cache is missing
+        """
+        if cache_path is None:
+            return requests.Session()
+        
+        try:
+            import requests_cache
+        except ImportError as e:
+            raise ImportError(
+                "Response caching requires the requests-cache package "
+                "(pip install requests-cache)"
+            ) from e
+        
+        session: requests.Session = requests_cache.CachedSession(
+            cache_path,
+            backend='sqlite',
+            expire_after=RESPONSE_CACHE_TTL,
+            allowable_methods=('GET', 'POST'),
+            cache_control=True
+        )
+        return session
+    
+    def _is_cached(self, url: str, data: Optional[str] = None) -> bool:
+        """Check whether a response for the request is already in the disk cache."""
+        cache = getattr(self._session, 'cache', None)
+        if cache is None:
+            return False
+        if data is None:
+            request = requests.Request('GET', url)
+        else:
+            request = requests.Request('POST', url, data=data, headers=_FORM_HEADERS)
+        return bool(cache.contains(request=request.prepare()))
     
-    def _make_request(self, url: str, retries: int = 3) -> str:
+    def close(self) -> None:
+        """Close the underlying HTTP session and the parser processes, if any."""
+        self._search_memo.clear()
+        self._session.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+    
+    def __enter__(self) -> 'PubMedClient':
+        """Use the client as a context manager that closes its session on exit."""
+        return self
+    
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        """Close the client's session."""
+        self.close()
+    
+    def _make_request(self, url: str, data: Optional[str] = None) -> bytes:
         """
         Make HTTP request with rate limiting and error handling.
         
+        Requests are sent as GET, or as a form POST when data is given.
+        
+        Connection errors and retryable status codes (429 and 5xx) are
+        retried with exponential backoff by the session's HTTPAdapter, which
+        also honours a Retry-After header on 429 responses.
+        
         Args:
             url: URL to request
-            retries: Number of retries on failure
+            data: Form-encoded body to POST instead of issuing a GET
             
         Returns:
-            Response text
+            Raw response body, left undecoded so that the XML parser can
+            honour the encoding declared in the document's prolog
             
         Raises:
             Exception: If request fails after retries
         """
-        # Rate limiting
-        time_since_last = time.time() - self.last_request_time
-        min_interval = 1.0 / self.rate_limit
-        
-        if time_since_last < min_interval:
-            sleep_time = min_interval - time_since_last
-            self.logger.debug(f"Rate limiting: sleeping {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        response = self._send(url, data)
         
-        for attempt in range(retries):
-            try:
-                self.logger.debug(f"Making request to: {url}")
-                request = Request(url, headers={
-                    'User-Agent': f'{self.tool_name}/1.0 (mailto:{self.email or "unknown@example.com"})'
-                })
-                
-                with urlopen(request, timeout=30) as response:
-                    self.last_request_time = time.time()
-                    data = response.read().decode('utf-8')
-                    self.logger.debug(f"Response received: {len(data)} characters")
-                    return data
-                    
-            except (HTTPError, URLError) as e:
-                self.logger.warning(f"Request failed (attempt {attempt + 1}/{retries}): {e}")
-                if attempt == retries - 1:
-                    raise Exception(f"Request failed after {retries} attempts: {e}")
-                time.sleep(2 ** attempt)  # Exponential backoff
-                
-        raise Exception("Request failed after all retries")
+        content = response.content
+        self.logger.debug(f"Response received: {len(content)} bytes")
+        return content
     
-    def _build_search_url(self, query: str, retmax: int = 10000, retstart: int = 0) -> str:
+    def _send(self, url: str, data: Optional[str] = None,
+              stream: bool = False) -> requests.Response:
         """
-        Build esearch URL.
+        Send a rate-limited request and check its status.
         
         Args:
-            query: Search query
-            retmax: Maximum results to return
-            retstart: Starting position
+            url: URL to request
+            data: Form-encoded body to POST instead of issuing a GET
+            stream: Leave the body unread so it can be consumed in chunks
             
         Returns:
-            Complete esearch URL
+            Response object
+            
+        Raises:
+            Exception: If request fails after retries
         """
-        params = {
-            'db': 'pubmed',
-            'term': query,
-            'retmax': str(retmax),
-            'retstart': str(retstart),
-            'usehistory': 'y',
-            'tool': self.tool_name
-        }
+        # Rate limiting; cached responses never reach NCBI
+        if not self._is_cached(url, data):
+            sleep_time = self._limiter.acquire()
+            if sleep_time > 0:
+                self.logger.debug(f"Rate limiting: slept {sleep_time:.2f} seconds")
         
-        if self.email:
-            params['email'] = self.email
-        if self.api_key:
-            params['api_key'] = self.api_key
-            
-        return f"{self.base_url}/esearch.fcgi?" + urlencode(params)
+        try:
+            self.logger.debug(f"Making request to: {url}")
+            if data is None:
+                response = self._session.get(url, timeout=30, stream=stream)
+            else:
+                response = self._session.post(url, data=data, headers=_FORM_HEADERS,
+                                              timeout=30, stream=stream)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise Exception(f"Request failed: {e}")
+        
+        return response
     
-    def _build_fetch_url(self, web_env: str, query_key: str, 
-                        retmax: int = 100, retstart: int = 0) -> str:
+    def _build_search_url(self, query: str, retmax: int = 10000, retstart: int = 0,
+                          retmode: str = 'xml') -> str:
         """
-        Build efetch URL.
+        Build esearch URL.
         
         Args:
-            web_env: Web environment from esearch
-            query_key: Query key from esearch
+            query: Search query
             retmax: Maximum results to return
             retstart: Starting position
+            retmode: Response format, 'xml' or 'json'
             
         Returns:
-            Complete efetch URL
-        """
-        params = {
-            'db': 'pubmed',
-            'WebEnv': web_env,
-            'query_key': query_key,
-            'retmax': str(retmax),
-            'retstart': str(retstart),
-            'retmode': 'xml',
-            'tool': self.tool_name
-        }
-        
-        if self.email:
-            params['email'] = self.email
-        if self.api_key:
-            params['api_key'] = self.api_key
-            
-        return f"{self.base_url}/efetch.fcgi?" + urlencode(params)
+            Complete esearch URL
+        """
+        return (f"{self.base_url}/esearch.fcgi?{self._common_qs}&retmode={retmode}"
+                f"&term={quote(query, safe='')}&retmax={retmax}&retstart={retstart}")
     
-    def _build_fetch_url_by_ids(self, pubmed_ids: List[str]) -> str:
+    def _build_fetch_request_by_ids(self, pubmed_ids: List[str]) -> Tuple[str, str]:
         """
-        Build efetch URL using explicit PubMed IDs.
+        Build an efetch POST request using explicit PubMed IDs.
+        
+        Parameters go in the request body, which avoids the URL length limit
+        for large ID batches.
         
         Args:
             pubmed_ids: List of PubMed IDs to fetch
             
         Returns:
-            Complete efetch URL
+            Tuple of (efetch URL, form-encoded request body)
         """
-        params = {
-            'db': 'pubmed',
-            'id': ','.join(pubmed_ids),
-            'retmode': 'xml',
-            'tool': self.tool_name
-        }
-        
-        if self.email:
-            params['email'] = self.email
-        if self.api_key:
-            params['api_key'] = self.api_key
-            
-        return f"{self.base_url}/efetch.fcgi?" + urlencode(params)
+        # PubMed IDs are digits joined by commas, which need no form encoding
+        body = f"{self._common_qs}&retmode=xml&id={','.join(pubmed_ids)}"
+        return f"{self.base_url}/efetch.fcgi", body
     
     def search(self, query: str, max_results: int = 10000) -> SearchResult:
         """
@@ -182,36 +518,21 @@ class PubMedClient:
         self.logger.info(f"Searching PubMed for: {query}")
         
         try:
-            url = self._build_search_url(query, retmax=max_results)
+            url = self._build_search_url(query, retmax=max_results, retmode='json')
             response = self._make_request(url)
             
-            # Parse XML response
-            root = ET.fromstring(response)
-            
-            # Extract results
-            count_elem = root.find('.//Count')
-            total_results = int(count_elem.text) if count_elem is not None else 0
-            
-            # Extract PubMed IDs
-            pubmed_ids = []
-            for id_elem in root.findall('.//Id'):
-                pubmed_ids.append(id_elem.text)
-            
-            # Extract web environment and query key for efetch
-            web_env_elem = root.find('.//WebEnv')
-            query_key_elem = root.find('.//QueryKey')
-            
-            web_env = web_env_elem.text if web_env_elem is not None else None
-            query_key = query_key_elem.text if query_key_elem is not None else None
+            # The JSON form of esearch is far cheaper to parse than its XML
+            result = json.loads(response)['esearchresult']
+            total_results = int(result.get('count', 0))
+            pubmed_ids = result.get('idlist', [])
             
             self.logger.info(f"Found {total_results} results, retrieved {len(pubmed_ids)} IDs")
             
+            # Papers are fetched by explicit ID, so no WebEnv/QueryKey is kept
             return SearchResult(
                 query=query,
                 total_results=total_results,
-                pubmed_ids=pubmed_ids,
-                web_env=web_env,
-                query_key=query_key
+                pubmed_ids=pubmed_ids
             )
             
         except Exception as e:
@@ -219,13 +540,11 @@ class PubMedClient:
             return SearchResult(
                 query=query,
                 total_results=0,
-                pubmed_ids=[],
-                web_env=None,
-                query_key=None
+                pubmed_ids=[]
             )
     
     def fetch_papers(self, search_result: SearchResult, 
-                    batch_size: int = 100) -> PubMedAPIResponse:
+                    batch_size: int = EFETCH_BATCH_SIZE) -> PubMedAPIResponse:
         """
         Fetch paper details from PubMed.
         
@@ -236,7 +555,6 @@ class PubMedClient:
         Returns:
             PubMedAPIResponse with paper details
         """
-        papers = []
         total_to_fetch = len(search_result.pubmed_ids)
         
         if total_to_fetch == 0:
@@ -249,53 +567,62 @@ class PubMedClient:
         
         self.logger.info(f"Fetching {total_to_fetch} papers (batch size: {batch_size})")
         
-        # For small result sets, fetch by explicit IDs to avoid WebEnv issues
-        if total_to_fetch <= 50:
-            self.logger.debug("Using direct ID fetching for small result set")
+        # Always fetch by explicit IDs. Each slice of IDs is an independent
+        # POST request, so several batches can be in flight at once; the rate
+        # limiter in _send still spaces out request starts.
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            batches = []
+            for start in range(0, total_to_fetch, batch_size):
+                batch_ids = search_result.pubmed_ids[start:start + batch_size]
+                batches.append((start, self._submit_batch(executor, start, batch_ids)))
+            
+            return self._collect_batches(batches, total_to_fetch)
+    
+    def _submit_batch(self, executor: ThreadPoolExecutor, start: int,
+                      batch_ids: List[str]) -> 'Future[List[Paper]]':
+        """Queue one efetch batch on the fetch thread pool."""
+        self.logger.debug(f"Fetching batch starting at {start} (size: {len(batch_ids)})")
+        
+        url, data = self._build_fetch_request_by_ids(batch_ids)
+        return executor.submit(self._fetch_batch, url, data)
+    
+    def _collect_batches(self, batches: List[Tuple[int, 'Future[List[Paper]]']],
+                         total_to_fetch: int) -> PubMedAPIResponse:
+        """
+        Wait for queued efetch batches and combine their papers.
+        
+        Args:
+            batches: (start offset, future) pairs in search ranking order
+            total_to_fetch: Number of PubMed IDs requested across all batches
+            
+        Returns:
+            PubMedAPIResponse with paper details; unsuccessful only if every
+            batch failed
+        """
+        papers = []
+        failed_batches = 0
+        last_error: Optional[Exception] = None
+        
+        # Collect in submission order so papers keep the search ranking
+        for start, future in batches:
             try:
-                url = self._build_fetch_url_by_ids(search_result.pubmed_ids)
-                response = self._make_request(url)
-                papers = self._parse_papers_xml(response)
+                batch_papers = future.result()
+                papers.extend(batch_papers)
                 
-                self.logger.debug(f"Retrieved {len(papers)} papers from direct ID fetch")
+                self.logger.debug(f"Retrieved {len(batch_papers)} papers from batch")
                 
             except Exception as e:
-                self.logger.error(f"Failed to fetch papers by IDs: {e}")
-                return PubMedAPIResponse(
-                    success=False,
-                    papers=[],
-                    error_message=f"Failed to fetch papers: {e}"
-                )
-        else:
-            # For large result sets, use WebEnv approach with proper limiting
-            if not search_result.web_env or not search_result.query_key:
-                return PubMedAPIResponse(
-                    success=False,
-                    papers=[],
-                    error_message="Invalid search result: missing web_env or query_key"
-                )
-            
-            for start in range(0, total_to_fetch, batch_size):
-                try:
-                    current_batch_size = min(batch_size, total_to_fetch - start)
-                    self.logger.debug(f"Fetching batch starting at {start} (size: {current_batch_size})")
-                    
-                    url = self._build_fetch_url(
-                        search_result.web_env, 
-                        search_result.query_key,
-                        retmax=current_batch_size,
-                        retstart=start
-                    )
-                    
-                    response = self._make_request(url)
-                    batch_papers = self._parse_papers_xml(response)
-                    papers.extend(batch_papers)
-                    
-                    self.logger.debug(f"Retrieved {len(batch_papers)} papers from batch")
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to fetch batch starting at {start}: {e}")
-                    continue
+                self.logger.error(f"Failed to fetch batch starting at {start}: {e}")
+                failed_batches += 1
+                last_error = e
+                continue
+        
+        if batches and failed_batches == len(batches):
+            return PubMedAPIResponse(
+                success=False,
+                papers=[],
+                error_message=f"Failed to fetch papers: {last_error}"
+            )
         
         self.logger.info(f"Successfully fetched {len(papers)} papers (requested: {total_to_fetch})")
         
@@ -306,7 +633,51 @@ class PubMedClient:
             retrieved_count=len(papers)
         )
     
-    def _parse_papers_xml(self, xml_content: str) -> List[Paper]:
+    def _fetch_batch(self, url: str, data: str) -> List[Paper]:
+        """
+        Fetch and parse one efetch batch.
+        
+        The response body is fed to the parser as it arrives, so parsing
+        overlaps with the download and the full payload is never held in
+        memory alongside the tree. With a parser process pool, the body is
+        downloaded whole and parsed in a worker process instead.
+        
+        Args:
+            url: efetch URL for the batch
+            data: Form-encoded body for the efetch POST request
+            
+        Returns:
+            List of Paper objects in the batch
+            
+        Raises:
+            Exception: If the request or reading its body keeps failing
+        """
+        for attempt in range(1, BODY_READ_ATTEMPTS + 1):
+            try:
+                if self._parse_pool is not None:
+                    # Read the body here so that a broken read is retried too
+                    with self._send(url, data, stream=True) as response:
+                        xml_content = response.content
+                    return self._parse_pool.submit(
+                        PubMedClient._parse_papers_xml, xml_content
+                    ).result()
+                
+                with self._send(url, data, stream=True) as response:
+                    return list(PubMedClient._iter_papers(
+                        response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+                    ))
+                    
+            except requests.RequestException as e:
+                # The body broke off mid-read; papers parsed so far are
+                # discarded and the whole batch is requested again
+                if attempt == BODY_READ_ATTEMPTS:
+                    raise Exception(f"Request failed: {e}")
+                self.logger.warning(f"Reading efetch response failed ({e}), retrying batch")
+        
+        return []
+    
+    @staticmethod
+    def _parse_papers_xml(xml_content: bytes) -> List[Paper]:
         """
         Parse XML response from efetch into Paper objects.
         
@@ -316,194 +687,228 @@ class PubMedClient:
         Returns:
             List of Paper objects
         """
-        papers = []
+        return list(PubMedClient._iter_papers((xml_content,)))
+    
+    @staticmethod
+    def _iter_papers(chunks: Iterable[bytes]) -> Iterator[Paper]:
+        """
+        Incrementally parse efetch XML fed in chunks.
         
-        try:
-            root = ET.fromstring(xml_content)
-            
-            # Handle both PubmedArticle and PubmedBookArticle
-            for article_elem in root.findall('.//PubmedArticle'):
-                paper = self._parse_single_paper(article_elem)
-                if paper:
-                    papers.append(paper)
-                    
-        except ET.ParseError as e:
-            self.logger.error(f"XML parsing error: {e}")
-        except Exception as e:
-            self.logger.error(f"Error parsing papers: {e}")
+        Articles are yielded as soon as their closing tag has been read and
+        then freed, so only one article's tree is held in memory at a time.
+        
+        Errors raised while producing chunks (e.g. a dropped connection) are
+        not caught here, so a truncated response fails instead of looking
+        like a short one.
+        
+        Args:
+            chunks: Successive pieces of the efetch XML response
             
-        return papers
+        Yields:
+            Paper objects in document order
+        """
+        # Shared copies of strings that repeat across the articles of one
+        # response (journal titles, ISSNs, affiliations)
+        interner: Dict[str, str] = {}
+        
+        parser = etree.XMLPullParser(
+            events=('end',),
+            tag='PubmedArticle',
+            huge_tree=True,
+            recover=True,
+            resolve_entities=False
+        )
+        
+        for chunk in chunks:
+            try:
+                parser.feed(chunk)
+            except etree.XMLSyntaxError as e:
+                logger.error(f"XML parsing error: {e}")
+                return
+            yield from PubMedClient._drain_articles(parser, interner)
+        
+        try:
+            parser.close()
+        except etree.XMLSyntaxError as e:
+            logger.error(f"XML parsing error: {e}")
+            return
+        yield from PubMedClient._drain_articles(parser, interner)
     
-    def _parse_single_paper(self, article_elem: ET.Element) -> Optional[Paper]:
+    @staticmethod
+    def _drain_articles(parser: etree.XMLPullParser,
+                        interner: Dict[str, str]) -> Iterator[Paper]:
+        """Parse and free every PubmedArticle the pull parser has completed."""
+        for _, article_elem in parser.read_events():
+            paper = PubMedClient._parse_single_paper(article_elem, interner)
+            if paper:
+                yield paper
+            
+            # Free this article and the already-parsed ones before it
+            article_elem.clear()
+            while article_elem.getprevious() is not None:
+                del article_elem.getparent()[0]
+    
+    @staticmethod
+    def _parse_single_paper(article_elem: etree._Element,
+                            interner: Optional[Dict[str, str]] = None) -> Optional[Paper]:
         """
         Parse a single PubmedArticle element into a Paper object.
         
         Args:
             article_elem: PubmedArticle XML element
+            interner: Canonical copies of repeated strings, shared across a response
             
         Returns:
             Paper object or None if parsing fails
         """
+        if interner is None:
+            interner = {}
+        
         try:
             # Extract basic information
-            medline_citation = article_elem.find('.//MedlineCitation')
+            medline_citation = _first(_XP_MEDLINE_CITATION, article_elem)
             if medline_citation is None:
                 return None
             
-            # PubMed ID
-            pmid_elem = medline_citation.find('.//PMID')
-            pubmed_id = pmid_elem.text if pmid_elem is not None else ""
-            
-            # Title
-            title_elem = medline_citation.find('.//ArticleTitle')
-            title = title_elem.text if title_elem is not None else ""
-            
-            # Abstract
-            abstract_elem = medline_citation.find('.//Abstract/AbstractText')
-            abstract = abstract_elem.text if abstract_elem is not None else None
-            
-            # Publication date
-            pub_date = self._parse_publication_date(medline_citation)
-            
-            # Journal information
-            journal = self._parse_journal(medline_citation)
-            
-            # Authors
-            authors = self._parse_authors(medline_citation)
-            
-            # DOI
-            doi = self._parse_doi(medline_citation)
-            
-            # PMC ID
-            pmc_id = self._parse_pmc_id(article_elem)
+            # One pass over the citation collects every field we need
+            fields = _CitationFields()
+            for elem in medline_citation.iter(*_CITATION_HANDLERS):
+                _CITATION_HANDLERS[elem.tag](fields, elem)
             
             return Paper(
-                pubmed_id=pubmed_id,
-                title=title,
-                publication_date=pub_date,
-                authors=authors,
-                journal=journal,
-                abstract=abstract,
-                doi=doi,
-                pmc_id=pmc_id
+                pubmed_id=fields.pmid or "",
+                title=fields.title or "",
+                publication_date=PubMedClient._parse_publication_date(fields),
+                authors=PubMedClient._parse_authors(fields, interner),
+                journal=PubMedClient._parse_journal(fields, interner),
+                abstract=fields.abstract,
+                doi=fields.doi,
+                pmc_id=PubMedClient._parse_pmc_id(article_elem)
             )
             
         except Exception as e:
-            self.logger.error(f"Error parsing single paper: {e}")
+            logger.error(f"Error parsing single paper: {e}")
             return None
     
-    def _parse_publication_date(self, citation_elem: ET.Element) -> Optional[date]:
-        """Parse publication date from citation element."""
-        try:
-            # Try DateCompleted first, then DateCreated
-            date_elem = citation_elem.find('.//DateCompleted')
-            if date_elem is None:
-                date_elem = citation_elem.find('.//DateCreated')
-            if date_elem is None:
-                date_elem = citation_elem.find('.//PubDate')
-            
-            if date_elem is not None:
-                year_elem = date_elem.find('.//Year')
-                month_elem = date_elem.find('.//Month')
-                day_elem = date_elem.find('.//Day')
-                
-                year = int(year_elem.text) if year_elem is not None else None
-                month = int(month_elem.text) if month_elem is not None else 1
-                day = int(day_elem.text) if day_elem is not None else 1
-                
-                if year:
-                    return date(year, month, day)
-                    
-        except (ValueError, AttributeError):
-            pass
+    @staticmethod
+    def _parse_publication_date(fields: _CitationFields) -> Optional[date]:
+        """Build the publication date, preferring DateCompleted, then DateCreated, then PubDate."""
+        for container in _DATE_CONTAINERS:
+            entry = fields.dates.get(container)
+            if entry is None:
+                continue
+            parts = entry[1]
+            # Malformed or impossible dates (e.g. Feb 31) leave the date unset
+            try:
+                year = int(parts['Year']) if 'Year' in parts else None
+                month = int(parts['Month']) if 'Month' in parts else 1
+                day = int(parts['Day']) if 'Day' in parts else 1
+                return date(year, month, day) if year else None
+            except (ValueError, TypeError):
+                return None
             
         return None
     
-    def _parse_journal(self, citation_elem: ET.Element) -> Journal:
-        """Parse journal information from citation element."""
-        journal_elem = citation_elem.find('.//Journal')
-        
-        if journal_elem is not None:
-            title_elem = journal_elem.find('.//Title')
-            issn_elem = journal_elem.find('.//ISSN')
-            volume_elem = journal_elem.find('.//Volume')
-            issue_elem = journal_elem.find('.//Issue')
-            
-            # Try to get page information
-            pages_elem = citation_elem.find('.//Pagination/MedlinePgn')
-            
-            return Journal(
-                title=title_elem.text if title_elem is not None else "",
-                issn=issn_elem.text if issn_elem is not None else None,
-                volume=volume_elem.text if volume_elem is not None else None,
-                issue=issue_elem.text if issue_elem is not None else None,
-                pages=pages_elem.text if pages_elem is not None else None
-            )
-        
-        return Journal(title="", issn=None, volume=None, issue=None, pages=None)
+    @staticmethod
+    def _parse_journal(fields: _CitationFields, interner: Dict[str, str]) -> Journal:
+        """Build journal information from the collected citation fields."""
+        if fields.journal is None:
+            return Journal(title="", issn=None, volume=None, issue=None, pages=None)
+        
+        # A journal recurs across many papers in a response, so share one
+        # copy of its title and ISSN
+        title = fields.journal_title or ""
+        issn = fields.issn
+        return Journal(
+            title=interner.setdefault(title, title),
+            issn=interner.setdefault(issn, issn) if issn else issn,
+            volume=fields.volume,
+            issue=fields.issue,
+            pages=fields.pages
+        )
     
-    def _parse_authors(self, citation_elem: ET.Element) -> List[Author]:
-        """Parse authors from citation element."""
+    @staticmethod
+    def _parse_authors(fields: _CitationFields, interner: Dict[str, str]) -> List[Author]:
+        """Build Author objects from the collected citation fields."""
         authors = []
         
-        author_list_elem = citation_elem.find('.//AuthorList')
-        if author_list_elem is not None:
-            for author_elem in author_list_elem.findall('.//Author'):
-                # Get author name information
-                last_name_elem = author_elem.find('.//LastName')
-                first_name_elem = author_elem.find('.//ForeName')
-                initials_elem = author_elem.find('.//Initials')
-                
-                # Get affiliation
-                affiliation_elem = author_elem.find('.//AffiliationInfo/Affiliation')
-                affiliation = affiliation_elem.text if affiliation_elem is not None else None
-                
-                # Extract email from affiliation if present
-                email = None
-                if affiliation:
-                    email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', affiliation)
-                    if email_match:
-                        email = email_match.group(0)
-                
-                author = Author(
-                    first_name=first_name_elem.text if first_name_elem is not None else None,
-                    last_name=last_name_elem.text if last_name_elem is not None else "",
-                    initials=initials_elem.text if initials_elem is not None else None,
-                    affiliation=affiliation,
-                    email=email,
-                    is_corresponding=False  # Will be determined later
-                )
-                
-                authors.append(author)
+        for parts in fields.authors:
+            affiliation = parts.get('Affiliation')
+            if affiliation:
+                # Co-authors from the same lab repeat the same affiliation
+                affiliation = interner.setdefault(affiliation, affiliation)
+            
+            # Extract email from affiliation if present
+            email = None
+            if affiliation:
+                email_match = _EMAIL_RE.search(affiliation)
+                if email_match:
+                    email = email_match.group(0)
+            
+            first_name = parts.get('ForeName')
+            last_name = parts.get('LastName') or ""
+            initials = parts.get('Initials')
+            
+            author = Author(
+                first_name=first_name,
+                last_name=last_name,
+                initials=initials,
+                affiliation=affiliation,
+                email=email,
+                is_corresponding=False,  # Will be determined later
+                display_name=Author.format_name(first_name, last_name, initials)
+            )
+            
+            authors.append(author)
         
         return authors
     
-    def _parse_doi(self, citation_elem: ET.Element) -> Optional[str]:
-        """Parse DOI from citation element."""
-        # DOI can be in different locations
-        doi_elem = citation_elem.find('.//ELocationID[@EIdType="doi"]')
-        if doi_elem is not None:
-            return doi_elem.text
-            
-        # Try alternative location
-        for elocation in citation_elem.findall('.//ELocationID'):
-            if elocation.get('EIdType') == 'doi':
-                return elocation.text
-                
-        return None
-    
-    def _parse_pmc_id(self, article_elem: ET.Element) -> Optional[str]:
+    @staticmethod
+    def _parse_pmc_id(article_elem: etree._Element) -> Optional[str]:
         """Parse PMC ID from article element."""
-        pmc_elem = article_elem.find('.//OtherID[@Source="NLM"]')
-        if pmc_elem is not None and pmc_elem.text and pmc_elem.text.startswith('PMC'):
-            return pmc_elem.text
-            
-        return None
+        pmc_ids = _XP_PMC_ID(article_elem)
+        return pmc_ids[0] if pmc_ids else None
     
     def search_and_fetch(self, query: str, max_results: int = 10000) -> PubMedAPIResponse:
         """
         Search and fetch papers in one operation.
         
+        Successful results are remembered for the client's lifetime, so
+        repeating a query returns the same response (and the same Paper
+        objects) without contacting PubMed or parsing again.
+        
+        Args:
+            query: Search query in PubMed format
+            max_results: Maximum number of results to return
+            
+        Returns:
+            PubMedAPIResponse with paper details
+        """
+        key = (query, max_results)
+        cached = self._search_memo.get(key)
+        if cached is not None:
+            self.logger.info(f"Reusing earlier results for: {query}")
+            self._search_memo.move_to_end(key)
+            return cached
+        
+        response = self._search_and_fetch_uncached(query, max_results)
+        
+        # Empty results are not kept, since search errors also come back empty
+        if response.success and response.papers:
+            if len(self._search_memo) >= SEARCH_MEMO_SIZE:
+                self._search_memo.popitem(last=False)
+            self._search_memo[key] = response
+        
+        return response
+    
+    def _search_and_fetch_uncached(self, query: str, max_results: int) -> PubMedAPIResponse:
+        """
+        Search and fetch papers without consulting the memo.
+        
+        The esearch response is streamed, and each efetch batch is queued as
+        soon as enough IDs have arrived, so fetching starts before the whole
+        ID list has been downloaded.
+        
         Args:
             query: Search query in PubMed format
             max_results: Maximum number of results to return
@@ -513,22 +918,87 @@ class PubMedClient:
         """
         self.logger.info(f"Starting search and fetch for: {query}")
         
-        # Search for papers
-        search_result = self.search(query, max_results)
+        url = self._build_search_url(query, retmax=max_results)
+        total_results = 0
+        batches = []
+        batch_ids: List[str] = []
+        queued = 0
         
-        if search_result.total_results == 0:
-            return PubMedAPIResponse(
-                success=True,
-                papers=[],
-                total_count=0,
-                retrieved_count=0
-            )
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            try:
+                with self._send(url, stream=True) as response:
+                    # Take data as it arrives so the first batch starts early
+                    chunks = response.iter_content(chunk_size=None)
+                    for tag, text in PubMedClient._iter_search_results(chunks):
+                        if tag == 'Count':
+                            total_results = int(text)
+                            continue
+                        
+                        # Never fetch more than was asked for
+                        if queued + len(batch_ids) >= max_results:
+                            break
+                        batch_ids.append(text)
+                        if len(batch_ids) == EFETCH_BATCH_SIZE:
+                            batches.append((queued, self._submit_batch(executor, queued, batch_ids)))
+                            queued += len(batch_ids)
+                            batch_ids = []
+                
+                if batch_ids:
+                    batches.append((queued, self._submit_batch(executor, queued, batch_ids)))
+                    queued += len(batch_ids)
+                    
+            except Exception as e:
+                self.logger.error(f"Search failed: {e}")
+                for _, future in batches:
+                    future.cancel()
+                batches, queued = [], 0
+            
+            self.logger.info(f"Found {total_results} results, fetching {queued} papers")
+            
+            if queued == 0:
+                return PubMedAPIResponse(
+                    success=True,
+                    papers=[],
+                    total_count=0,
+                    retrieved_count=0
+                )
+            
+            return self._collect_batches(batches, queued)
+    
+    @staticmethod
+    def _iter_search_results(chunks: Iterable[bytes]) -> Iterator[Tuple[str, str]]:
+        """
+        Incrementally parse esearch XML fed in chunks.
         
-        # Limit the number of IDs to actually fetch based on max_results
-        actual_ids_to_fetch = min(len(search_result.pubmed_ids), max_results)
-        if actual_ids_to_fetch < len(search_result.pubmed_ids):
-            search_result.pubmed_ids = search_result.pubmed_ids[:actual_ids_to_fetch]
-            self.logger.info(f"Limited fetch to {actual_ids_to_fetch} papers as requested")
+        Args:
+            chunks: Successive pieces of the esearch XML response
+            
+        Yields:
+            ('Count', total result count) once, then ('Id', PubMed ID) for
+            each ID in ranking order
+        """
+        parser = etree.XMLPullParser(
+            events=('end',),
+            tag=('Count', 'Id'),
+            huge_tree=True,
+            recover=True,
+            resolve_entities=False
+        )
         
-        # Fetch paper details
-        return self.fetch_papers(search_result) 
\ No newline at end of file
+        def drain() -> Iterator[Tuple[str, str]]:
+            for _, elem in parser.read_events():
+                # TranslationStack has Count elements of its own; only the
+                # top-level total and the IdList entries are wanted
+                parent_tag = _parent_tag(elem)
+                if elem.text and (
+                    (elem.tag == 'Count' and parent_tag == 'eSearchResult')
+                    or (elem.tag == 'Id' and parent_tag == 'IdList')
+                ):
+                    yield elem.tag, elem.text
+                elem.clear()
+        
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from drain()
+        parser.close()
+        yield from drain()
@@ -2,11 +2,23 @@
 Setup script for pubmed-pharma-papers package.
 """
 
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optionally compile the author classifier hot path to a C extension with
+# mypyc (requires mypy[mypyc]), e.g.
+#   PUBMED_PHARMA_PAPERS_MYPYC=1 python setup.py build_ext --inplace
+# Without it the pure-Python module is used.
+ext_modules = []
+if os.environ.get("PUBMED_PHARMA_PAPERS_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["pubmed_pharma_papers/author_classifier.py"])
+
 setup(
     name="get-papers-list",
     version="0.1.0",
@@ -16,6 +28,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.8",
@@ -32,8 +45,13 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.25.0",
+        "urllib3>=1.26",
         "pandas>=1.3.0",
+        "lxml>=4.9",
     ],
+    extras_require={
+        "cache": ["requests-cache>=1.0"],
+    },
     entry_points={
         "console_scripts": [
             "get-papers-list=pubmed_pharma_papers.cli:main",
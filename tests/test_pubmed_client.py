@@ -0,0 +1,140 @@
+"""
+Tests for parsing efetch XML into Paper objects.
+
+Expected values were produced by the original ElementTree-based parser on
+tests/data/efetch_sample.xml, so the lxml single-pass parser is checked
+field by field against its results.
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from pubmed_pharma_papers.models import Journal, Paper
+from pubmed_pharma_papers.pubmed_client import PubMedClient
+
+
+SAMPLE_XML = Path(__file__).parent / "data" / "efetch_sample.xml"
+
+
+@pytest.fixture(scope="module")
+def efetch_xml() -> bytes:
+    """Raw efetch response with four articles."""
+    return SAMPLE_XML.read_bytes()
+
+
+@pytest.fixture(scope="module")
+def papers(efetch_xml: bytes) -> List[Paper]:
+    """Papers parsed from the sample efetch response."""
+    return PubMedClient._parse_papers_xml(efetch_xml)
+
+
+def test_every_article_is_parsed(papers: List[Paper]) -> None:
+    assert [paper.pubmed_id for paper in papers] == [
+        "11111111", "22222222", "33333333", "44444444"
+    ]
+
+
+def test_full_citation_fields(papers: List[Paper]) -> None:
+    paper = papers[0]
+
+    # The PMID of a cited article in CommentsCorrections must not win
+    assert paper.pubmed_id == "11111111"
+    assert paper.title == "A trial of things & stuff."
+    # DateCompleted is preferred over DateRevised and PubDate
+    assert paper.publication_date == date(2021, 3, 15)
+    # Only the first AbstractText is kept
+    assert paper.abstract == "Background text."
+    # The DOI is picked out of several ELocationIDs
+    assert paper.doi == "10.1000/xyz123"
+    assert paper.pmc_id is None
+    assert paper.journal == Journal(
+        title="Journal of Drug Things",
+        issn="1234-5678",
+        volume="12",
+        issue="3",
+        pages="100-110",
+    )
+
+
+def test_authors(papers: List[Paper]) -> None:
+    doe, smith, consortium = papers[0].authors
+
+    assert (doe.first_name, doe.last_name, doe.initials) == ("Jane", "Doe", "J")
+    # Only the first affiliation is kept
+    assert doe.affiliation == "Pfizer Inc., New York, NY, USA. jane.doe@pfizer.com."
+    assert doe.email == "jane.doe@pfizer.com"
+    assert doe.get_display_name() == "Jane Doe"
+
+    assert (smith.first_name, smith.last_name, smith.initials) == (None, "Smith", "B")
+    assert smith.affiliation == "Department of Oncology, Harvard Medical School, Boston, MA."
+    assert smith.email is None
+    assert smith.get_display_name() == "Smith B"
+
+    # Collective authors have no name parts
+    assert (consortium.first_name, consortium.last_name, consortium.initials) == (None, "", None)
+    assert consortium.affiliation is None
+    assert consortium.email is None
+
+
+def test_minimal_citation_fields(papers: List[Paper]) -> None:
+    paper = papers[1]
+
+    # Falls back to PubDate, with month and day defaulting to 1
+    assert paper.publication_date == date(2019, 1, 1)
+    assert paper.abstract is None
+    assert paper.doi is None
+    assert paper.pmc_id == "PMC1234567"
+    assert paper.journal == Journal(
+        title="Journal of Drug Things", issn=None, volume=None, issue=None, pages=None
+    )
+
+    [lee] = paper.authors
+    assert (lee.first_name, lee.last_name, lee.initials) == ("Kim", "Lee", "K")
+    assert lee.affiliation == "Genentech, South San Francisco, CA"
+    assert lee.email is None
+
+
+def test_impossible_date_keeps_paper(papers: List[Paper]) -> None:
+    paper = papers[2]
+
+    # DateCompleted 2023-02-31 is not a real date
+    assert paper.publication_date is None
+    assert paper.title == "An impossible completion date"
+    assert paper.journal == Journal(
+        title="Clinical Pharmacology Letters", issn="2222-3333", volume="7", issue=None, pages=None
+    )
+
+    # Investigators are not authors
+    [novak] = paper.authors
+    assert (novak.first_name, novak.last_name) == ("Ana", "Novak")
+    assert novak.email == "ana.novak@novartis.com"
+
+
+def test_non_numeric_month_and_non_pmc_other_id(papers: List[Paper]) -> None:
+    paper = papers[3]
+
+    assert paper.publication_date is None
+    assert paper.doi == "10.1000/abc-44"
+    assert paper.pmc_id is None
+
+    # Only the first AuthorList is read; the editors list is not
+    [okafor] = paper.authors
+    assert (okafor.first_name, okafor.last_name, okafor.initials) == (None, "Okafor", "C")
+    assert okafor.affiliation is None
+
+
+def test_repeated_journal_titles_are_shared(papers: List[Paper]) -> None:
+    assert papers[0].journal.title is papers[1].journal.title
+    assert papers[2].journal.title is papers[3].journal.title
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_chunked_parse_matches_whole_parse(
+    efetch_xml: bytes, papers: List[Paper], chunk_size: int
+) -> None:
+    chunks = (efetch_xml[i:i + chunk_size] for i in range(0, len(efetch_xml), chunk_size))
+
+    assert list(PubMedClient._iter_papers(chunks)) == papers